@@ -5,10 +5,17 @@ Pydantic models for request/response validation
 from pydantic import BaseModel, Field
 from typing import Optional
 
+import config
+
 
 class TranslateRequest(BaseModel):
     """Request model for code translation"""
-    source_code: str = Field(..., min_length=1, description="Source code to translate")
+    source_code: str = Field(
+        ...,
+        min_length=1,
+        max_length=config.MAX_CODE_LENGTH,
+        description="Source code to translate",
+    )
     source_language: str = Field(..., description="Source programming language")
     target_language: str = Field(..., description="Target programming language")
 
@@ -3,15 +3,18 @@ API Client for authentication and code translation
 """
 
 import logging
+import time
 from typing import Optional
 
-import requests
 import httpx
 from openai import OpenAI
-import config
+from config import SETTINGS
 
 logger = logging.getLogger(__name__)
 
+# Language tags that may appear after an opening code fence
+_LANG_TAGS = frozenset({"python", "java", "c", "cpp", "go", "rust"})
+
 
 class APIClient:
     """
@@ -22,13 +25,30 @@ class APIClient:
     """
 
     def __init__(self) -> None:
-        self.base_url: Optional[str] = getattr(config, "BASE_URL", None)
+        self.base_url: Optional[str] = SETTINGS.base_url or None
         self.token: Optional[str] = None
-        self.api_key: Optional[str] = getattr(config, "INFERENCE_API_KEY", None)
-        self.http_client = httpx.Client(verify=False)
+        self._token_expiry: float = float("inf")
+        self.api_key: Optional[str] = SETTINGS.inference_api_key or None
+        # Memoized OpenAI client, rebuilt only when the auth key rotates
+        self._openai_client: Optional[OpenAI] = None
+        self._openai_client_key: Optional[str] = None
+        # BASE_URL never changes at runtime, so normalize it exactly once
+        self._api_root: Optional[str] = (
+            self._normalized_api_root() if self.base_url else None
+        )
+        # Shared pooled client: keep-alive connections amortize the TLS
+        # handshake across the token exchange and all chat completions.
+        self.http_client = httpx.Client(
+            verify=False,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            timeout=httpx.Timeout(5.0, read=60.0),
+        )
 
         self.auth_mode = "open"
-        self._init_auth()
+        # Auth is deferred to the first inference call so constructing the
+        # singleton (e.g. during app startup or /health) never blocks on
+        # a Keycloak round-trip.
+        self._auth_attempted = False
 
     # ------------------------------------------------------------------
     # Authentication
@@ -38,23 +58,32 @@ class APIClient:
         # 1) Keycloak
         if (
             self.base_url
-            and getattr(config, "KEYCLOAK_CLIENT_ID", None)
-            and getattr(config, "KEYCLOAK_CLIENT_SECRET", None)
+            and SETTINGS.keycloak_client_id
+            and SETTINGS.keycloak_client_secret
         ):
             token_url = f"{self.base_url.rstrip('/')}/token"
             payload = {
                 "grant_type": "client_credentials",
-                "client_id": config.KEYCLOAK_CLIENT_ID,
-                "client_secret": config.KEYCLOAK_CLIENT_SECRET,
+                "client_id": SETTINGS.keycloak_client_id,
+                "client_secret": SETTINGS.keycloak_client_secret,
             }
 
             try:
                 logger.info("Authenticating with Keycloak at %s", token_url)
-                response = requests.post(token_url, data=payload, verify=False)
+                response = self.http_client.post(token_url, data=payload)
 
                 if response.status_code == 200:
-                    self.token = response.json().get("access_token")
+                    data = response.json()
+                    self.token = data.get("access_token")
                     if self.token:
+                        # Refresh ~30s before the token actually expires so
+                        # in-flight requests never carry a stale token.
+                        expires_in = data.get("expires_in")
+                        self._token_expiry = (
+                            time.monotonic() + float(expires_in) - 30
+                            if expires_in
+                            else float("inf")
+                        )
                         self.auth_mode = "keycloak"
                         logger.info("Keycloak authentication successful")
                         return
@@ -77,6 +106,13 @@ class APIClient:
         logger.info("No auth configured, running in open mode")
         self.auth_mode = "open"
 
+    def _current_token(self) -> Optional[str]:
+        """Return a valid Keycloak token, re-authenticating if it expired."""
+        if self.token and time.monotonic() >= self._token_expiry:
+            logger.info("Keycloak token expired, re-authenticating")
+            self._init_auth()
+        return self.token
+
     # ------------------------------------------------------------------
     # OpenAI Client Builder
     # ------------------------------------------------------------------
@@ -112,21 +148,32 @@ class APIClient:
         The OpenAI SDK will append /chat/completions itself when
         you call client.chat.completions.create(...).
         """
-        api_root = self._normalized_api_root()
+        if self._api_root is None:
+            raise ValueError("BASE_URL must be configured")
+
+        if not self._auth_attempted:
+            self._auth_attempted = True
+            self._init_auth()
 
         # Choose which key the OpenAI client sends
         if self.auth_mode == "keycloak" and self.token:
-            key = self.token
+            key = self._current_token() or "no-auth"
         elif self.auth_mode == "api_key" and self.api_key:
             key = self.api_key
         else:
             key = "no-auth"
 
-        return OpenAI(
+        # Reuse the memoized client unless the key rotated (token refresh)
+        if self._openai_client is not None and self._openai_client_key == key:
+            return self._openai_client
+
+        self._openai_client = OpenAI(
             api_key=key,
-            base_url=api_root,
+            base_url=self._api_root,
             http_client=self.http_client,
         )
+        self._openai_client_key = key
+        return self._openai_client
 
     def get_inference_client(self) -> OpenAI:
         return self._get_openai_client()
@@ -134,32 +181,46 @@ class APIClient:
     # ------------------------------------------------------------------
     # Code Translation
     # ------------------------------------------------------------------
+
+    # Constant prompt pieces hoisted to class scope so per-call assembly is
+    # a single format_map over an already-built template.
+    _SYSTEM_PROMPT = (
+        "You are a senior software engineer. Translate code between languages. "
+        "Output only the translated code. Do not add markdown or explanations."
+    )
+    _USER_TEMPLATE = """
+Translate the following {src} code into {tgt}.
+Return only the translated {tgt} code. No markdown fences.
+
+Source ({src}):
+{code}
+"""
+
     def translate_code(self, source_code: str, source_lang: str, target_lang: str) -> str:
         """Translate code using OpenAI-style chat completions."""
+        # Reject oversized payloads before paying for prompt construction
+        # and a model round-trip.
+        if len(source_code) > SETTINGS.max_code_length:
+            raise ValueError(
+                f"Source code exceeds maximum length of "
+                f"{SETTINGS.max_code_length} characters"
+            )
+
         client = self._get_openai_client()
 
-        system_prompt = (
-            "You are a senior software engineer. Translate code between languages. "
-            "Output only the translated code. Do not add markdown or explanations."
+        user_prompt = self._USER_TEMPLATE.format_map(
+            {"src": source_lang, "tgt": target_lang, "code": source_code}
         )
 
-        user_prompt = f"""
-Translate the following {source_lang} code into {target_lang}.
-Return only the translated {target_lang} code. No markdown fences.
-
-Source ({source_lang}):
-{source_code}
-"""
-
         try:
             response = client.chat.completions.create(
-                model=config.INFERENCE_MODEL_NAME,
+                model=SETTINGS.inference_model_name,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": self._SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt},
                 ],
-                max_tokens=config.LLM_MAX_TOKENS,
-                temperature=config.LLM_TEMPERATURE,
+                max_tokens=SETTINGS.llm_max_tokens,
+                temperature=SETTINGS.llm_temperature,
             )
 
             content = response.choices[0].message.content or ""
@@ -174,13 +235,18 @@ Source ({source_lang}):
         """Remove ```python fences and language tags."""
         t = text.strip()
 
-        if t.startswith("```") and t.endswith("```"):
+        # The prompt asks for unfenced output, so this is the common case:
+        # bail before doing any splitting or set lookups.
+        if not t.startswith("```"):
+            return t
+
+        if t.endswith("```"):
             t = t[3:-3].strip()
 
         # Remove leading language tag line if present
-        first_line = t.split("\n", 1)[0].lower().strip()
-        if first_line in {"python", "java", "c", "cpp", "go", "rust"}:
-            t = "\n".join(t.split("\n")[1:])
+        nl = t.find("\n")
+        if nl != -1 and t[:nl].strip().lower() in _LANG_TAGS:
+            t = t[nl + 1 :]
 
         return t.strip()
 
@@ -10,7 +10,7 @@ import os
 import logging
 import json
 
-from services import pdf_service, llm_service
+from services import pdf_service, get_llm_service
 import config
 from models import HealthResponse
 
@@ -68,7 +68,7 @@ async def summarize_document(
         # ========== Text Input ==========
         if type == "text" and messages.strip():
             logger.info("Processing text input")
-            summary = llm_service.summarize(
+            summary = get_llm_service().summarize(
                 text=messages,
                 max_tokens=max_tokens,
                 stream=stream_bool
@@ -111,7 +111,7 @@ async def summarize_document(
                         raise HTTPException(status_code=400, detail=f"No text found in {file_type}")
 
                     logger.info(f"Extracted {len(text_content)} characters, generating summary")
-                    summary = llm_service.summarize(
+                    summary = get_llm_service().summarize(
                         text=text_content,
                         max_tokens=max_tokens,
                         stream=stream_bool
@@ -140,7 +140,7 @@ async def summarize_document(
                         raise HTTPException(status_code=400, detail="No text found in file")
 
                     logger.info(f"Read {len(text_content)} characters, generating summary")
-                    summary = llm_service.summarize(
+                    summary = get_llm_service().summarize(
                         text=text_content,
                         max_tokens=max_tokens,
                         stream=stream_bool
@@ -1,5 +1,5 @@
 import logging
-import requests
+import time
 import httpx
 from openai import OpenAI
 import config
@@ -17,11 +17,20 @@ class APIClient:
     def __init__(self) -> None:
         self.base_url = getattr(config, "BASE_URL", "").rstrip("/")
         self.token = None                  # Keycloak access token
+        self._token_expiry = float("inf")  # monotonic deadline for refresh
         self.api_key = getattr(config, "INFERENCE_API_KEY", None)
-        self.http_client = httpx.Client(verify=False)
+        # Pooled keep-alive client shared by the token exchange and all
+        # chat completion calls, so TLS setup is paid once per connection.
+        self.http_client = httpx.Client(
+            verify=False,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            timeout=httpx.Timeout(5.0, read=60.0),
+        )
         self.auth_mode = "open"            # "keycloak", "api_key", or "open"
 
-        self._init_auth()
+        # Deferred: auth happens on the first get_inference_client() call,
+        # not at construction, so startup and /health never block on Keycloak.
+        self._auth_attempted = False
 
     def _init_auth(self) -> None:
         """Try Keycloak, then API key, then open mode."""
@@ -41,10 +50,18 @@ class APIClient:
                     "client_secret": config.KEYCLOAK_CLIENT_SECRET,
                 }
 
-                response = requests.post(token_url, data=payload, verify=False)
+                response = self.http_client.post(token_url, data=payload)
 
                 if response.status_code == 200:
-                    self.token = response.json().get("access_token")
+                    data = response.json()
+                    self.token = data.get("access_token")
+                    # Refresh ~30s early so requests never carry a stale token
+                    expires_in = data.get("expires_in")
+                    self._token_expiry = (
+                        time.monotonic() + float(expires_in) - 30
+                        if expires_in
+                        else float("inf")
+                    )
                     self.auth_mode = "keycloak"
                     logger.info("Keycloak authentication successful")
                     return
@@ -65,6 +82,13 @@ class APIClient:
         self.auth_mode = "open"
         logger.info("No authentication configured, using open mode")
 
+    def _current_token(self):
+        """Return a valid Keycloak token, re-authenticating if it expired."""
+        if self.token and time.monotonic() >= self._token_expiry:
+            logger.info("Keycloak token expired, re-authenticating")
+            self._init_auth()
+        return self.token
+
     def get_inference_client(self) -> OpenAI:
         """
         Create an OpenAI-compatible client.
@@ -77,9 +101,13 @@ class APIClient:
         if not self.base_url:
             raise ValueError("BASE_URL must be set in environment or config")
 
+        if not self._auth_attempted:
+            self._auth_attempted = True
+            self._init_auth()
+
         # Pick the correct key based on auth tier
         if self.auth_mode == "keycloak" and self.token:
-            key = self.token
+            key = self._current_token() or "no-auth"
         elif self.auth_mode == "api_key" and self.api_key:
             key = self.api_key
         else:
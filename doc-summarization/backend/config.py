@@ -2,11 +2,88 @@
 Configuration settings for Doc-Sum Application
 """
 
+import hashlib
+import json
 import os
-from dotenv import load_dotenv
+import tempfile
+from functools import cache
+
+from dotenv import dotenv_values
+
+# Anchored to this module's directory so services launched from another
+# CWD still find their .env (matching load_dotenv's find_dotenv behavior)
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+# Keys whose names suggest credentials are never written to the on-disk
+# cache; only their names are recorded so a cache hit knows when it must
+# fall back to a full parse
+_SECRET_MARKERS = ("SECRET", "KEY", "TOKEN", "PASSWORD")
+
+
+def _is_secret(name: str) -> bool:
+    upper = name.upper()
+    return any(marker in upper for marker in _SECRET_MARKERS)
+
+
+def _env_cache_path(env_path: str) -> str:
+    """Per-file cache location shared by all workers reloading the same .env."""
+    digest = hashlib.md5(os.path.abspath(env_path).encode()).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f".env.cache.{digest}")
+
+
+@cache
+def _load_env() -> None:
+    """
+    Load .env at most once per process, skipping the parse entirely when an
+    mtime-keyed cache from a previous (re)load is still valid. Keeps
+    uvicorn --reload loops from re-parsing an unchanged .env in every child.
+
+    Secret-bearing values never leave the process: the cache stores only
+    non-sensitive values plus the names of secret keys, and is bypassed
+    whenever a recorded secret is not already present in the environment.
+    """
+    try:
+        mtime_ns = os.stat(_ENV_FILE).st_mtime_ns
+    except OSError:
+        return  # no .env file present
+
+    cache_path = _env_cache_path(_ENV_FILE)
+    try:
+        with open(cache_path) as fh:
+            cached = json.load(fh)
+        if cached.get("mtime_ns") == mtime_ns and all(
+            name in os.environ for name in cached.get("secret_keys", ())
+        ):
+            for key, value in cached["values"].items():
+                os.environ.setdefault(key, value)
+            return
+    except (OSError, ValueError):
+        pass
+
+    values = {k: v for k, v in dotenv_values(_ENV_FILE).items() if v is not None}
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+    public = {k: v for k, v in values.items() if not _is_secret(k)}
+    secret_keys = sorted(k for k in values if _is_secret(k))
+    try:
+        fd = os.open(cache_path + ".tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as fh:
+            json.dump(
+                {
+                    "mtime_ns": mtime_ns,
+                    "values": public,
+                    "secret_keys": secret_keys,
+                },
+                fh,
+            )
+        os.replace(cache_path + ".tmp", cache_path)
+    except OSError:
+        pass  # cache is best-effort only
+
 
 # Load environment variables
-load_dotenv()
+_load_env()
 
 # Inference Gateway base URL
 BASE_URL = os.getenv("BASE_URL")
@@ -5,6 +5,7 @@ FastAPI server for Doc-Sum Application
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 import config
@@ -22,7 +23,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title=config.APP_TITLE,
     description=config.APP_DESCRIPTION,
-    version=config.APP_VERSION
+    version=config.APP_VERSION,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
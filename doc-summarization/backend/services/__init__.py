@@ -1,6 +1,6 @@
 """Services module - Business logic layer"""
 
 from .pdf_service import pdf_service
-from .llm_service import llm_service
+from .llm_service import get_llm_service
 
-__all__ = ["pdf_service", "llm_service"]
+__all__ = ["pdf_service", "get_llm_service"]
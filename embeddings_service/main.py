@@ -1,38 +1,154 @@
-from typing import List, Union
+import asyncio
+import base64
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
+
+import numpy as np
+
+import torch
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sentence_transformers import SentenceTransformer
 
-app = FastAPI(title="Local Embeddings API")
+# orjson serializes numpy arrays natively, so the float path skips both
+# .tolist() and stdlib json's per-float encoding.
+app = FastAPI(title="Local Embeddings API", default_response_class=ORJSONResponse)
+
+# BGE on CPU, loaded lazily on the first embeddings request so uvicorn
+# startup and /health probes never block on the multi-second model load.
+_model = None
+_model_lock = threading.Lock()
 
-# Load BGE on CPU
-model = SentenceTransformer("BAAI/bge-base-en-v1.5")
+
+def get_model() -> SentenceTransformer:
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                m = SentenceTransformer("BAAI/bge-base-en-v1.5")
+                m.eval()
+                # Dynamically quantize the transformer's Linear layers to
+                # int8: CPU inference is matmul-bound, and int8 halves the
+                # weight bandwidth (VNNI/AVX2 dot-products where available).
+                m[0].auto_model = torch.quantization.quantize_dynamic(
+                    m[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                _model = m
+    return _model
 
 
 class EmbeddingRequest(BaseModel):
     model: str
     input: Union[str, List[str]]
+    # OpenAI-compatible: "float" (JSON lists) or "base64" (packed fp32 bytes)
+    encoding_format: Optional[str] = "float"
+
+
+# Micro-batching: requests arriving within MAX_WAIT_MS are coalesced into a
+# single model.encode forward pass, which amortizes tokenization setup and
+# kernel dispatch over the combined batch.
+MAX_BATCH = 32
+MAX_WAIT_MS = 8
+
+_queue: "asyncio.Queue[tuple[List[str], asyncio.Future]]" = asyncio.Queue()
+
+# Single dedicated inference thread: Torch parallelizes internally, so more
+# threads here would only queue inside Torch's own intra-op pool.
+_encode_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def _encode(texts: List[str]):
+    with torch.inference_mode():
+        return get_model().encode(texts, batch_size=32, convert_to_numpy=True)
+
+
+async def _batch_worker() -> None:
+    """Drain concurrent embedding requests into single encode calls."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _queue.get()]
+        deadline = loop.time() + MAX_WAIT_MS / 1000
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        all_texts = [t for texts, _ in batch for t in texts]
+        try:
+            # Offload the forward pass to the inference thread so the event
+            # loop keeps serving requests; the numpy array is kept and each
+            # handler converts only its own slice.
+            embeddings = await loop.run_in_executor(
+                _encode_executor, _encode, all_texts
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            continue
+
+        # Scatter each request's slice back onto its future
+        offset = 0
+        for texts, future in batch:
+            if not future.done():
+                future.set_result(embeddings[offset : offset + len(texts)])
+            offset += len(texts)
+
+
+@app.on_event("startup")
+async def _start_batch_worker():
+    # Pin Torch to the physical cores and a single inter-op thread so the
+    # lone inference thread isn't oversubscribed by Torch's own pools.
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+    torch.set_num_interop_threads(1)
+    app.state.batch_task = asyncio.create_task(_batch_worker())
 
 
 @app.post("/v1/embeddings")
-def create_embeddings(request: EmbeddingRequest):
+async def create_embeddings(request: EmbeddingRequest):
     # Normalize input to list
     if isinstance(request.input, str):
         texts = [request.input]
     else:
         texts = request.input
 
-    embeddings = model.encode(texts, convert_to_numpy=True).tolist()
+    # Hand off to the micro-batcher and wait for this request's slice
+    future = asyncio.get_running_loop().create_future()
+    await _queue.put((texts, future))
+    embeddings = await future
 
-    data = []
-    for idx, emb in enumerate(embeddings):
-        data.append(
+    if request.encoding_format == "base64":
+        # Packed fp32 bytes: skips allocating ~768 Python floats per vector
+        # and shrinks the JSON payload for internal callers.
+        data = [
+            {
+                "object": "embedding",
+                "index": idx,
+                "embedding": base64.b64encode(
+                    np.ascontiguousarray(emb, dtype=np.float32).tobytes()
+                ).decode("ascii"),
+            }
+            for idx, emb in enumerate(embeddings)
+        ]
+    else:
+        # Rows stay numpy; the explicit ORJSONResponse below serializes
+        # them natively. (A plain dict return would go through FastAPI's
+        # jsonable_encoder first, which rejects ndarrays.)
+        data = [
             {
                 "object": "embedding",
                 "index": idx,
                 "embedding": emb,
             }
-        )
+            for idx, emb in enumerate(embeddings)
+        ]
 
     # Token counts are just placeholders so the client does not crash
     usage = {
@@ -40,12 +156,14 @@ def create_embeddings(request: EmbeddingRequest):
         "total_tokens": 0,
     }
 
-    return {
-        "object": "list",
-        "data": data,
-        "model": request.model,
-        "usage": usage,
-    }
+    return ORJSONResponse(
+        {
+            "object": "list",
+            "data": data,
+            "model": request.model,
+            "usage": usage,
+        }
+    )
 
 
 @app.get("/health")
@@ -30,6 +30,11 @@ if not (OPENAI_API_KEY or KEYCLOAK_CLIENT_SECRET or INFERENCE_API_KEY):
         "You must set one of OPENAI_API_KEY, KEYCLOAK_CLIENT_SECRET, or INFERENCE_API_KEY"
     )
     
+# Embedding batch packing: a batch is closed once it holds this many
+# texts or this many (estimated) tokens, whichever comes first
+MAX_BATCH_COUNT = int(os.getenv("MAX_BATCH_COUNT", "96"))
+MAX_BATCH_TOKENS = int(os.getenv("MAX_BATCH_TOKENS", "8192"))
+
 # Application Settings
 APP_TITLE = "Multi-Agent Q&A"
 APP_DESCRIPTION = "A multi-agent Q&A system using CrewAI"
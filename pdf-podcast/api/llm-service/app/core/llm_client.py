@@ -1,13 +1,43 @@
-from openai import OpenAI
-import requests
+from openai import AsyncOpenAI
+import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
+import asyncio
 import logging
+import time
+from functools import lru_cache
 from typing import Optional
 
+import tiktoken
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive sync client for Keycloak token fetches, with connect
+# retries on transient failures, so refreshes skip DNS+TCP+TLS setup and
+# the process carries one HTTP stack (httpx) instead of two.
+_keycloak_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=5),
+    transport=httpx.HTTPTransport(retries=3),
+    timeout=10,
+)
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(model: str):
+    """BPE encoders are expensive to build (merge-file parse); cache per model."""
+    return tiktoken.encoding_for_model(model)
+
+
+@lru_cache(maxsize=32)
+def _sys_msg(prompt: str) -> dict:
+    """
+    System prompts are static per workflow, so reuse one dict per prompt
+    instead of rebuilding (and re-serializing) it on every completion.
+    Treat the returned dict as read-only.
+    """
+    return {"role": "system", "content": prompt}
+
 
 class LLMClient:
     """
@@ -29,9 +59,10 @@ class LLMClient:
         """
 
         self.base_url = settings.BASE_URL.rstrip("/") if settings.BASE_URL else None
-        self.client: Optional[OpenAI] = None
+        self.client: Optional[AsyncOpenAI] = None
         self.api_key: Optional[str] = None
         self.auth_mode: str = "none"
+        self._token_expires_at: Optional[float] = None
 
         if not self.base_url:
             logger.error(
@@ -39,6 +70,10 @@ class LLMClient:
             )
             return
 
+        # Derived once; token refreshes and completions hit these repeatedly
+        self._v1_url = f"{self.base_url}/v1"
+        self._token_url = f"{self.base_url}/token"
+
         # 1) Try Keycloak first
         if settings.KEYCLOAK_CLIENT_ID and settings.KEYCLOAK_CLIENT_SECRET:
             token = self._try_keycloak_token()
@@ -62,9 +97,18 @@ class LLMClient:
 
         self.default_model = settings.INFERENCE_MODEL_NAME or default_model
 
-        self.client = OpenAI(
+        # Explicit pooled transport so every completion reuses keep-alive
+        # connections instead of the SDK's per-instance defaults. HTTP/2
+        # lets concurrent completions multiplex over one TLS connection.
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        )
+        self.client = AsyncOpenAI(
             api_key=self.api_key,
-            base_url=f"{self.base_url}/v1",
+            base_url=self._v1_url,
+            http_client=self.http_client,
         )
         logger.info(
             "LLMClient: configured OpenAI compatible client at %s/v1 (auth_mode=%s)",
@@ -79,7 +123,6 @@ class LLMClient:
         if not self.base_url:
             return None
 
-        token_url = f"{self.base_url}/token"
         payload = {
             "grant_type": "client_credentials",
             "client_id": settings.KEYCLOAK_CLIENT_ID,
@@ -87,11 +130,15 @@ class LLMClient:
         }
 
         try:
-            resp = requests.post(token_url, data=payload, timeout=10, verify=False)
+            resp = _keycloak_client.post(self._token_url, data=payload)
             if resp.status_code == 200:
                 data = resp.json()
                 token = data.get("access_token")
                 if token:
+                    expires_in = data.get("expires_in")
+                    self._token_expires_at = (
+                        time.time() + float(expires_in) if expires_in else None
+                    )
                     return token
                 logger.error("LLMClient: Keycloak response missing access_token")
             else:
@@ -105,6 +152,40 @@ class LLMClient:
 
         return None
 
+    def schedule_token_refresh(self) -> Optional["asyncio.Task"]:
+        """
+        Start the background Keycloak refresh loop. Call from app startup;
+        returns None when no refreshable token is in use.
+        """
+        if self.auth_mode != "keycloak":
+            return None
+        return asyncio.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the token shortly before expiry so requests never 401."""
+        while True:
+            if self._token_expires_at is None:
+                delay = 300.0
+            else:
+                delay = max(self._token_expires_at - time.time() - 60.0, 5.0)
+            await asyncio.sleep(delay)
+
+            # The fetch is sync httpx with retries; run it in a worker
+            # thread so a slow Keycloak can't freeze the event loop
+            token = await asyncio.to_thread(self._try_keycloak_token)
+            if token:
+                self.api_key = token
+                if self.client:
+                    # The SDK reads api_key per request, so swapping it in
+                    # place rotates the Bearer header without a rebuild.
+                    self.client.api_key = token
+                logger.info("LLMClient: refreshed Keycloak token")
+            else:
+                logger.warning(
+                    "LLMClient: Keycloak token refresh failed, retrying in 30s"
+                )
+                await asyncio.sleep(30)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -135,10 +216,10 @@ class LLMClient:
         )
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=use_model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    _sys_msg(system_prompt),
                     {"role": "user", "content": user_prompt},
                 ],
                 temperature=temperature,
@@ -177,10 +258,7 @@ class LLMClient:
         Uses tiktoken as a rough approximation. This does not talk to OpenAI.
         """
         try:
-            import tiktoken
-
-            encoding = tiktoken.encoding_for_model(model)
-            return len(encoding.encode(text))
+            return len(_get_encoder(model).encode(text))
         except Exception as e:
             logger.error(f"Token counting failed: {str(e)}")
             return len(text) // 4
@@ -62,6 +62,13 @@ async def startup_event():
 
     logger.info(f"Default model: {settings.INFERENCE_MODEL_NAME}")
 
+    # Keep the Keycloak token fresh in the background (no-op for other auth)
+    from app.api.routes import dialogue_generator
+
+    app.state.token_refresh_task = (
+        dialogue_generator.llm_client.schedule_token_refresh()
+    )
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
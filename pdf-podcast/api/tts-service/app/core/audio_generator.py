@@ -2,7 +2,6 @@ from pathlib import Path
 import logging
 import uuid
 from typing import Dict, List, Optional
-import asyncio
 
 from app.core.tts_client import TTSClient
 from app.core.audio_mixer import AudioMixer
@@ -167,36 +166,20 @@ class AudioGenerator:
         Returns:
             List of segment paths
         """
-        segment_paths = []
-        total = len(texts)
-
-        # Create tasks for parallel generation
-        tasks = []
-        for i, (text, voice) in enumerate(zip(texts, voices)):
-            output_path = output_dir / f"segment_{i:03d}.mp3"
-            segment_paths.append(output_path)
-
-            task = self.tts_client.generate_speech(
-                text=text,
-                voice=voice,
-                output_path=output_path
-            )
-            tasks.append((i, task))
-
-        # Process with progress tracking
-        completed = 0
-        semaphore = asyncio.Semaphore(5)  # Limit concurrent requests
-
-        async def process_with_progress(index, task):
-            nonlocal completed
-            async with semaphore:
-                await task
-                completed += 1
-                if progress_callback and completed % 5 == 0:
-                    progress = (completed / total) * 100
-                    await progress_callback(progress)
-
-        await asyncio.gather(*[process_with_progress(i, task) for i, task in tasks])
+        segment_paths = [
+            output_dir / f"segment_{i:03d}.mp3" for i in range(len(texts))
+        ]
+
+        async def report_progress(completed: int, total: int):
+            if progress_callback and completed % 5 == 0:
+                await progress_callback((completed / total) * 100)
+
+        # Concurrency cap and jitter live in the client so every caller
+        # gets the same MAX_CONCURRENT_REQUESTS behaviour
+        await self.tts_client.generate_speech_batch(
+            list(zip(texts, voices, segment_paths)),
+            progress_callback=report_progress if progress_callback else None,
+        )
 
         logger.info(f"Generated {len(segment_paths)} segments")
         return segment_paths
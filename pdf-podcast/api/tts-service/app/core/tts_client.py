@@ -1,13 +1,23 @@
 # app/core/tts_client.py
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional
+import os
+import random
+import shutil
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 import httpx
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Most recent cache entries kept by the startup eviction sweep
+TTS_CACHE_MAX_ENTRIES = 512
+
 
 class TTSClient:
     """
@@ -22,9 +32,20 @@ class TTSClient:
         self.api_key: Optional[str] = None
 
         if not self.base_url:
+            # Leave the client unconfigured but attribute-complete so
+            # shutdown teardown (aclose) never hits an AttributeError
+            self._v1_base: Optional[str] = None
+            self._client: Optional[httpx.AsyncClient] = None
             logger.error("TTSClient: TTS_BASE_URL is not set.")
             return
 
+        # Derived once; every generate_speech call targets this base
+        self._v1_base = (
+            self.base_url
+            if self.base_url.endswith("/v1")
+            else f"{self.base_url}/v1"
+        )
+
         # Try Keycloak first
         token = self._try_keycloak_token()
         if token:
@@ -43,12 +64,64 @@ class TTSClient:
                 "TTSClient: no auth configured. Calls will be unauthenticated."
             )
 
+        # One pooled client for the life of the TTSClient: keep-alive
+        # connections are reused across turns instead of paying a TCP+TLS
+        # handshake per generate_speech call. HTTP/2 lets concurrent turns
+        # multiplex over one or two sockets instead of one socket each.
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        )
+
+        # Persistent audio cache keyed on content hash: regenerating a
+        # script where only a few turns changed skips TTS for the rest.
+        self._cache_dir = Path(settings.OUTPUT_DIR) / ".tts_cache"
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._evict_cache()
+
+    async def aclose(self) -> None:
+        """Release the pooled connections (wired to app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+
     def _tts_v1_base(self) -> Optional[str]:
-        if not self.base_url:
-            return None
-        if self.base_url.endswith("/v1"):
-            return self.base_url
-        return f"{self.base_url}/v1"
+        return self._v1_base
+
+    def _cache_path(self, text: str, voice: str, format_: str) -> Path:
+        key = hashlib.sha256(
+            f"{self.model}|{voice}|{format_}|{text}".encode("utf-8")
+        ).hexdigest()
+        return self._cache_dir / f"{key}.{format_}"
+
+    @staticmethod
+    def _copy_from_cache(cache_path: Path, output_path: Path) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if output_path.exists():
+                output_path.unlink()
+            os.link(cache_path, output_path)
+        except OSError:
+            # Cross-device or filesystem without hardlinks
+            shutil.copy(cache_path, output_path)
+
+    def _evict_cache(self) -> None:
+        """Drop the oldest cache entries beyond TTS_CACHE_MAX_ENTRIES."""
+        try:
+            entries = sorted(
+                (p for p in self._cache_dir.iterdir() if p.is_file()),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
+            for stale in entries[TTS_CACHE_MAX_ENTRIES:]:
+                stale.unlink(missing_ok=True)
+            if len(entries) > TTS_CACHE_MAX_ENTRIES:
+                logger.info(
+                    "TTSClient: evicted %d stale cache entries",
+                    len(entries) - TTS_CACHE_MAX_ENTRIES,
+                )
+        except OSError as exc:
+            logger.warning("TTSClient: cache eviction sweep failed: %s", exc)
 
     def _build_headers(self) -> dict:
         headers = {}
@@ -104,6 +177,11 @@ class TTSClient:
         if not self.base_url:
             raise ValueError("TTS_BASE_URL is not configured")
 
+        cache_path = self._cache_path(text, voice, format_)
+        if cache_path.exists():
+            self._copy_from_cache(cache_path, output_path)
+            return
+
         url = f"{self._tts_v1_base()}/audio/speech"
 
         payload = {
@@ -115,12 +193,59 @@ class TTSClient:
 
         headers = self._build_headers()
 
-        async with httpx.AsyncClient(timeout=120) as client:
-            resp = await client.post(url, json=payload, headers=headers)
-        resp.raise_for_status()
-
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_bytes(resp.content)
+
+        # Stream the audio straight to disk so peak memory per turn is one
+        # 64 KiB chunk rather than the whole payload. Write to a private
+        # temp name first so a concurrent identical turn never reads a
+        # half-written cache entry; os.replace is atomic.
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with self._client.stream(
+                "POST", url, json=payload, headers=headers
+            ) as resp:
+                resp.raise_for_status()
+                with tmp_path.open("wb") as f:
+                    async for chunk in resp.aiter_bytes(chunk_size=65536):
+                        f.write(chunk)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self._copy_from_cache(cache_path, output_path)
+
+    async def generate_speech_batch(
+        self,
+        items: List[Tuple[str, str, object]],
+        progress_callback: Optional[Callable] = None,
+    ) -> None:
+        """
+        Generate many (text, voice, output_path) turns concurrently, capped
+        at MAX_CONCURRENT_REQUESTS in-flight requests. Wall time drops to
+        roughly N / concurrency turn durations instead of N.
+
+        progress_callback, if given, is awaited as (completed, total) after
+        each finished turn.
+        """
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+        completed = 0
+        total = len(items)
+
+        async def _one(text: str, voice: str, output_path) -> None:
+            nonlocal completed
+            async with semaphore:
+                # Stagger the initial burst so turns don't all hit the
+                # gateway in the same instant
+                await asyncio.sleep(random.uniform(0, 0.1))
+                await self.generate_speech(
+                    text=text, voice=voice, output_path=output_path
+                )
+            completed += 1
+            if progress_callback:
+                await progress_callback(completed, total)
+
+        await asyncio.gather(*(_one(t, v, p) for t, v, p in items))
 
     def is_available(self) -> bool:
         return self.base_url is not None
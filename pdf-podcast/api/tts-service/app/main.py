@@ -1,5 +1,8 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 import logging
@@ -20,35 +23,10 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app
-app = FastAPI(
-    title="TTS Audio Generation Service",
-    description="Generate podcast audio from scripts using OpenAI TTS",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Mount static files
-static_dir = Path(settings.OUTPUT_DIR)
-static_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-
-# Include routers
-app.include_router(router, tags=["Audio Generation"])
-
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown logic; replaces the deprecated on_event hooks."""
     logger.info("TTS Audio Generation Service starting up...")
     logger.info("Service running on port %s", getattr(settings, "SERVICE_PORT", 8003))
 
@@ -85,12 +63,61 @@ async def startup_event():
     static_dir.mkdir(parents=True, exist_ok=True)
     logger.info("Output directory: %s", static_dir.absolute())
 
+    # Readiness flips only once setup is done, so orchestrators don't
+    # route traffic to a worker that is still warming up
+    app.state.ready = True
+
+    yield
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown"""
+    app.state.ready = False
+    from app.api.routes import audio_generator
+
+    await audio_generator.tts_client.aclose()
     logger.info("TTS Audio Generation Service shutting down...")
 
+
+# Create FastAPI app
+app = FastAPI(
+    title="TTS Audio Generation Service",
+    description="Generate podcast audio from scripts using OpenAI TTS",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+)
+app.state.ready = False
+
+# Add CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Mount static files
+static_dir = Path(settings.OUTPUT_DIR)
+static_dir.mkdir(parents=True, exist_ok=True)
+app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+
+# Include routers
+app.include_router(router, tags=["Audio Generation"])
+
+@app.get("/health/live")
+async def health_live():
+    """Liveness probe: the process is up and serving."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def health_ready():
+    """Readiness probe: 503 until lifespan setup has completed."""
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
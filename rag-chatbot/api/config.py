@@ -4,6 +4,9 @@ Gateway-centric inference via an OpenAI-compatible API surface.
 """
 
 import os
+from dataclasses import dataclass
+from typing import Optional
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -20,6 +23,7 @@ BASE_URL = os.getenv("BASE_URL", "https://api.example.com")
 EMBEDDINGS_BASE_URL = os.getenv("EMBEDDINGS_BASE_URL", BASE_URL)
 
 # Keycloak client-credentials (preferred if provided)
+KEYCLOAK_TOKEN_URL = os.getenv("KEYCLOAK_TOKEN_URL", "")
 KEYCLOAK_REALM = os.getenv("KEYCLOAK_REALM", "master")
 KEYCLOAK_CLIENT_ID = os.getenv("KEYCLOAK_CLIENT_ID", "")
 KEYCLOAK_CLIENT_SECRET = os.getenv("KEYCLOAK_CLIENT_SECRET")
@@ -93,3 +97,33 @@ CORS_ALLOW_ORIGINS = ["*"]  # Update with specific origins in production
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_METHODS = ["*"]
 CORS_ALLOW_HEADERS = ["*"]
+
+
+# -------------------------------------------------------------------
+# Typed settings snapshot
+# -------------------------------------------------------------------
+# Immutable view over the values above. Hot paths read attributes off
+# this object (slots: no per-access dict hashing, no getattr defaults)
+# instead of getattr(config, ...) per call. The module globals stay for
+# backwards compatibility.
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    base_url: str = BASE_URL
+    embeddings_base_url: str = EMBEDDINGS_BASE_URL
+    keycloak_token_url: str = KEYCLOAK_TOKEN_URL
+    keycloak_realm: str = KEYCLOAK_REALM
+    keycloak_client_id: str = KEYCLOAK_CLIENT_ID
+    keycloak_client_secret: Optional[str] = KEYCLOAK_CLIENT_SECRET
+    inference_api_key: Optional[str] = INFERENCE_API_KEY
+    embeddings_model_name: str = EMBEDDINGS_MODEL_NAME
+    inference_model_name: str = INFERENCE_MODEL_NAME
+    max_file_size: int = MAX_FILE_SIZE
+    vector_store_path: str = VECTOR_STORE_PATH
+    chunk_size: int = CHUNK_SIZE
+    chunk_overlap: int = CHUNK_OVERLAP
+    top_k_documents: int = TOP_K_DOCUMENTS
+
+
+settings = Settings()
@@ -17,7 +17,7 @@ from models import (
 from services import (
     validate_pdf_file, load_and_split_pdf,
     store_in_vector_storage, load_vector_store, delete_vector_store,
-    query_documents
+    query_documents, close_api_client
 )
 
 # Configure logging
@@ -35,13 +35,23 @@ async def lifespan(app: FastAPI):
     app.state.vectorstore = load_vector_store()
     if app.state.vectorstore:
         logger.info("✓ FAISS vector store loaded successfully")
+        # Pre-touch the index with a throwaway search so the first real
+        # query doesn't pay the mmap page-fault cost
+        try:
+            dim = app.state.vectorstore.index.d
+            app.state.vectorstore.similarity_search_by_vector([0.0] * dim, k=1)
+            logger.info("✓ FAISS index pre-warmed (%d dims)", dim)
+        except Exception as e:
+            logger.warning("FAISS pre-warm failed: %s", e)
     else:
         logger.info("! No existing vector store found. Please upload a PDF document.")
     
-    yield
-    
-    # Shutdown
-    logger.info("Shutting down RAG Chatbot API")
+    try:
+        yield
+    finally:
+        # Shutdown
+        close_api_client()
+        logger.info("Shutting down RAG Chatbot API")
 
 
 # Initialize FastAPI app
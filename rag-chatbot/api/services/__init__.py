@@ -5,7 +5,7 @@ Services package for RAG Chatbot API
 from .pdf_service import load_and_split_pdf, validate_pdf_file
 from .vector_service import store_in_vector_storage, load_vector_store, delete_vector_store
 from .retrieval_service import build_retrieval_chain, query_documents
-from .api_client import APIClient, get_api_client
+from .api_client import APIClient, get_api_client, close_api_client
 
 __all__ = [
     'load_and_split_pdf',
@@ -16,6 +16,7 @@ __all__ = [
     'build_retrieval_chain',
     'query_documents',
     'APIClient',
-    'get_api_client'
+    'get_api_client',
+    'close_api_client'
 ]
 
@@ -3,20 +3,26 @@ Retrieval service
 Handles query processing and retrieval chain operations
 """
 
+import functools
+import io
 import logging
-from typing import List, Optional, Any, Dict
+from typing import TYPE_CHECKING, List, Optional, Any, Dict
 
-from langchain_community.vectorstores import FAISS
-from langchain.chains.retrieval import create_retrieval_chain
-from langchain.chains.combine_documents import create_stuff_documents_chain
-from langchain import hub
+# langchain_community / langchain.chains / hub are deferred to
+# build_retrieval_chain: they dominate worker cold start and endpoints
+# like /health never need them. Only the lightweight langchain_core base
+# classes are needed at import time.
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.language_models.llms import LLM
 from langchain_core.outputs import LLMResult, Generation
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
 
+from config import settings
 from .api_client import get_api_client
 
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,19 +68,23 @@ class CustomChatModel(BaseChatModel):
     ) -> LLMResult:
         api_client = get_api_client()
 
-        prompt_parts: List[str] = []
-
+        # Write straight into one buffer; long chat histories otherwise
+        # allocate a string per message plus the joined copy
+        buf = io.StringIO()
         for msg in messages:
             if isinstance(msg, SystemMessage):
-                prompt_parts.append(f"System: {msg.content}")
+                buf.write(f"System: {msg.content}\n\n")
             elif isinstance(msg, HumanMessage):
-                prompt_parts.append(f"User: {msg.content}")
+                buf.write(f"User: {msg.content}\n\n")
             elif isinstance(msg, AIMessage):
-                prompt_parts.append(f"Assistant: {msg.content}")
+                buf.write(f"Assistant: {msg.content}\n\n")
 
-        full_prompt = "\n\n".join(prompt_parts)
-        if not full_prompt.endswith("Assistant:"):
-            full_prompt += "\n\nAssistant:"
+        full_prompt = buf.getvalue()
+        if full_prompt.rstrip("\n").endswith("Assistant:"):
+            full_prompt = full_prompt.rstrip("\n")
+        else:
+            buf.write("Assistant:")
+            full_prompt = buf.getvalue()
 
         logger.info("Sending prompt to gateway (length: %s chars)", len(full_prompt))
 
@@ -95,7 +105,18 @@ def get_llm() -> BaseChatModel:
     return CustomChatModel()
 
 
-def build_retrieval_chain(vectorstore: FAISS):
+@functools.lru_cache(maxsize=1)
+def _get_retrieval_prompt():
+    """
+    Pull the retrieval-qa-chat prompt once; it is static, and hub.pull
+    goes over the network on every call otherwise.
+    """
+    from langchain import hub
+
+    return hub.pull("langchain-ai/retrieval-qa-chat")
+
+
+def build_retrieval_chain(vectorstore: "FAISS"):
     """
     Build retrieval chain with the custom chat model
 
@@ -106,7 +127,10 @@ def build_retrieval_chain(vectorstore: FAISS):
         Configured retrieval chain
     """
     try:
-        retrieval_qa_chat_prompt = hub.pull("langchain-ai/retrieval-qa-chat")
+        from langchain.chains.retrieval import create_retrieval_chain
+        from langchain.chains.combine_documents import create_stuff_documents_chain
+
+        retrieval_qa_chat_prompt = _get_retrieval_prompt()
         llm = get_llm()
         combine_docs_chain = create_stuff_documents_chain(
             llm,
@@ -122,7 +146,7 @@ def build_retrieval_chain(vectorstore: FAISS):
         raise
 
 
-def query_documents(query: str, vectorstore: FAISS) -> Dict[str, str]:
+def query_documents(query: str, vectorstore: "FAISS") -> Dict[str, str]:
     """
     Query the documents using RAG with custom embedding and inference
 
@@ -138,12 +162,13 @@ def query_documents(query: str, vectorstore: FAISS) -> Dict[str, str]:
 
         api_client = get_api_client()
 
-        logger.info("Creating query embedding")
-        query_embedding = api_client.embed_text(query)
-        logger.info("Query embedding dimension: %s", len(query_embedding))
-
+        # similarity_search embeds the query through the vectorstore's
+        # wired-in embeddings and searches in one step, saving a separate
+        # gateway round-trip
         logger.info("Searching for similar documents")
-        similar_docs = vectorstore.similarity_search_by_vector(query_embedding, k=4)
+        similar_docs = vectorstore.similarity_search(
+            query, k=settings.top_k_documents
+        )
         logger.info("Found %s similar documents", len(similar_docs))
 
         if not similar_docs:
@@ -152,11 +177,12 @@ def query_documents(query: str, vectorstore: FAISS) -> Dict[str, str]:
                 "query": query,
             }
 
-        context_parts: List[str] = []
-        for i, doc in enumerate(similar_docs):
-            context_parts.append(f"Document {i + 1}:\n{doc.page_content}")
-
-        context = "\n\n".join(context_parts)
+        # Feed join from a generator: no intermediate list of per-doc
+        # strings held alongside the joined result
+        context = "\n\n".join(
+            f"Document {i + 1}:\n{doc.page_content}"
+            for i, doc in enumerate(similar_docs)
+        )
         logger.info("Context length: %s characters", len(context))
 
         prompt = f"""Based on the following documents, provide a clear answer that addresses the question.
@@ -6,14 +6,18 @@ Handles FAISS vector store operations
 import os
 import logging
 import shutil
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from langchain_community.vectorstores import FAISS
+# FAISS (via langchain_community) is deferred to the functions that use
+# it so importing this module stays cheap for non-RAG endpoints
 from langchain_core.embeddings import Embeddings
 
-import config
+from config import settings
 from .api_client import get_api_client
 
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
+
 logger = logging.getLogger(__name__)
 
 class CustomEmbeddings(Embeddings):
@@ -22,7 +26,16 @@ class CustomEmbeddings(Embeddings):
     """
 
     def __init__(self) -> None:
-        self.api_client = get_api_client()
+        # Deferred: constructing the APIClient triggers the Keycloak token
+        # fetch, which must not sit on the startup critical path when
+        # load_vector_store() runs at boot
+        self._api_client = None
+
+    @property
+    def api_client(self):
+        if self._api_client is None:
+            self._api_client = get_api_client()
+        return self._api_client
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """
@@ -59,7 +72,7 @@ def get_embeddings() -> Embeddings:
     return CustomEmbeddings()
 
 
-def store_in_vector_storage(chunks: list) -> FAISS:
+def store_in_vector_storage(chunks: list) -> "FAISS":
     """
     Create embeddings and store in FAISS vector store
 
@@ -73,16 +86,18 @@ def store_in_vector_storage(chunks: list) -> FAISS:
         Exception: If storage operation fails
     """
     try:
+        from langchain_community.vectorstores import FAISS
+
         embeddings = get_embeddings()
         vectorstore = FAISS.from_documents(chunks, embeddings)
 
         # Ensure directory exists
         os.makedirs(
-            os.path.dirname(config.VECTOR_STORE_PATH) or ".",
+            os.path.dirname(settings.vector_store_path) or ".",
             exist_ok=True,
         )
-        vectorstore.save_local(config.VECTOR_STORE_PATH)
-        logger.info(f"Saved vector store to {config.VECTOR_STORE_PATH}")
+        vectorstore.save_local(settings.vector_store_path)
+        logger.info(f"Saved vector store to {settings.vector_store_path}")
 
         return vectorstore
     except Exception as e:
@@ -90,7 +105,7 @@ def store_in_vector_storage(chunks: list) -> FAISS:
         raise
 
 
-def load_vector_store() -> Optional[FAISS]:
+def load_vector_store() -> Optional["FAISS"]:
     """
     Load existing FAISS vector store
 
@@ -98,13 +113,15 @@ def load_vector_store() -> Optional[FAISS]:
         FAISS vectorstore instance or None if not found
     """
     try:
-        if not os.path.exists(config.VECTOR_STORE_PATH):
-            logger.warning(f"No vector store found at {config.VECTOR_STORE_PATH}")
+        if not os.path.exists(settings.vector_store_path):
+            logger.warning(f"No vector store found at {settings.vector_store_path}")
             return None
 
+        from langchain_community.vectorstores import FAISS
+
         embeddings = get_embeddings()
         vectorstore = FAISS.load_local(
-            config.VECTOR_STORE_PATH,
+            settings.vector_store_path,
             embeddings,
             allow_dangerous_deserialization=True,
         )
@@ -126,8 +143,8 @@ def delete_vector_store() -> bool:
         Exception: If deletion fails
     """
     try:
-        if os.path.exists(config.VECTOR_STORE_PATH):
-            shutil.rmtree(config.VECTOR_STORE_PATH)
+        if os.path.exists(settings.vector_store_path):
+            shutil.rmtree(settings.vector_store_path)
             logger.info("Deleted vector store")
             return True
         return False
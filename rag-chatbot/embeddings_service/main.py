@@ -1,7 +1,10 @@
 import os
+import threading
 from typing import List, Union, Optional
 
-from fastapi import FastAPI
+import numpy as np
+import torch
+from fastapi import FastAPI, Request, Response
 from pydantic import BaseModel
 from sentence_transformers import SentenceTransformer
 
@@ -9,8 +12,24 @@ MODEL_NAME = os.getenv("EMBEDDINGS_MODEL_NAME", "BAAI/bge-base-en-v1.5")
 
 app = FastAPI(title="Local Embeddings Service")
 
-# Load model once at startup
-model = SentenceTransformer(MODEL_NAME)
+# Loaded lazily on the first embeddings request: a module-level load would
+# materialize the model once in the `python main.py` process and again in
+# each uvicorn worker that re-imports "main:app". fp16 halves memory
+# traffic on GPU with no measurable quality loss for bge-style encoders.
+_model: Optional[SentenceTransformer] = None
+_model_lock = threading.Lock()
+
+
+def get_model() -> SentenceTransformer:
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                m = SentenceTransformer(MODEL_NAME)
+                if torch.cuda.is_available():
+                    m.half()
+                _model = m
+    return _model
 
 
 class EmbeddingRequest(BaseModel):
@@ -24,7 +43,7 @@ def health():
 
 
 @app.post("/v1/embeddings")
-def create_embeddings(req: EmbeddingRequest):
+def create_embeddings(req: EmbeddingRequest, request: Request):
     # Allow override of model name in request, but ignore for now
     texts: List[str]
     if isinstance(req.input, str):
@@ -33,20 +52,41 @@ def create_embeddings(req: EmbeddingRequest):
         texts = req.input
 
     # sentence-transformers returns a numpy array when convert_to_numpy=True
-    embeddings = model.encode(texts, convert_to_numpy=True).tolist()
-
-    data = []
-    for idx, emb in enumerate(embeddings):
-        data.append(
-            {
-                "object": "embedding",
-                "embedding": emb,
-                "index": idx,
-            }
+    embeddings = get_model().encode(
+        texts,
+        batch_size=64,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+
+    # Binary fast path: raw fp16 bytes instead of ~500KB of ASCII floats
+    # per 64-text batch; the shape header lets the caller reshape
+    if "application/octet-stream" in (request.headers.get("accept") or ""):
+        matrix = embeddings.astype(np.float16)
+        return Response(
+            content=matrix.tobytes(),
+            media_type="application/octet-stream",
+            headers={
+                "X-Embedding-Shape": f"{matrix.shape[0]},{matrix.shape[1]}",
+            },
         )
 
-    # Very rough token usage estimate, just to satisfy clients that expect it
-    total_tokens = sum(len(t.split()) for t in texts)
+    # Convert row by row instead of .tolist() on the whole matrix, which
+    # would materialize every batch's floats at once
+    data = [
+        {
+            "object": "embedding",
+            "embedding": emb.tolist(),
+            "index": idx,
+        }
+        for idx, emb in enumerate(embeddings)
+    ]
+
+    # Very rough token usage estimate, just to satisfy clients that expect
+    # it. Counting separators avoids materializing a list of word strings
+    # per text the way .split() does.
+    total_tokens = sum(t.count(" ") + 1 for t in texts)
 
     return {
         "object": "list",
@@ -57,3 +97,19 @@ def create_embeddings(req: EmbeddingRequest):
             "total_tokens": total_tokens,
         },
     }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Multi-worker serving: scale with UVICORN_WORKERS (or the standard
+    # WEB_CONCURRENCY). The lazy get_model() means neither this supervisor
+    # process nor uvicorn's master ever holds a model copy; each serving
+    # worker loads exactly one on its first request.
+    workers = int(os.getenv("UVICORN_WORKERS", os.getenv("WEB_CONCURRENCY", "1")))
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8080")),
+        workers=workers,
+    )